@@ -18,9 +18,9 @@ License: MIT
 """
 
 import argparse
-import csv
 import sys
 import numpy as np
+import pandas as pd
 
 
 def load_control_points(csv_path):
@@ -31,30 +31,60 @@ def load_control_points(csv_path):
         csv_path (str): Path to CSV file with control points
 
     Returns:
-        list: List of tuples ((image_x, image_y), (longitude, latitude))
+        np.ndarray: Nx4 array of (image_x, image_y, longitude, latitude) rows
 
     Raises:
         ValueError: If CSV format is invalid or fewer than 2 control points
     """
-    control_points = []
-    with open(csv_path, 'r') as f:
-        reader = csv.reader(f)
-        header = next(reader)  # Skip header
-        for row in reader:
-            try:
-                latitude = float(row[1])
-                longitude = float(row[2])
-                image_x = float(row[3])
-                image_y = float(row[4])
-                control_points.append(((image_x, image_y), (longitude, latitude)))
-            except (ValueError, IndexError) as e:
-                print(f"Error parsing row: {row}", file=sys.stderr)
-                raise ValueError("CSV must contain values in format: description,latitude,longitude,image_x,image_y")
-
-    if len(control_points) < 2:
+    try:
+        # Columns by position: 1=latitude, 2=longitude, 3=image_x, 4=image_y
+        df = pd.read_csv(csv_path, header=None, skiprows=1, usecols=[1, 2, 3, 4],
+                         skipinitialspace=True, skip_blank_lines=False,
+                         on_bad_lines='error')
+        data = df[[3, 4, 2, 1]].to_numpy(np.float64)
+        if np.isnan(data).any():
+            # Short or blank rows are padded with NaN rather than rejected
+            raise ValueError("missing value in one or more rows")
+    except (ValueError, IndexError) as e:
+        print(f"Error parsing {csv_path}: {e}", file=sys.stderr)
+        raise ValueError("CSV must contain values in format: description,latitude,longitude,image_x,image_y")
+
+    if len(data) < 2:
         raise ValueError("At least 2 control points are required for linear transform")
 
-    return control_points
+    return data
+
+
+def fit_line(x, y):
+    """
+    Fit y = scale * x + offset by ordinary least squares.
+
+    Uses the closed-form slope/intercept on mean-centered values, which is
+    exact for a single-variable fit and avoids a general lstsq solve.
+
+    Args:
+        x (np.ndarray): Independent values
+        y (np.ndarray): Dependent values
+
+    Returns:
+        tuple: (scale, offset)
+
+    Raises:
+        ValueError: If all x values are identical
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+
+    var = dx @ dx
+    if var == 0:
+        raise ValueError("Control points must not all share the same image coordinate")
+
+    scale = (dx @ (y - y_mean)) / var
+    offset = y_mean - scale * x_mean
+    return scale, offset
 
 
 def compute_linear_transform(control_points):
@@ -62,28 +92,27 @@ def compute_linear_transform(control_points):
     Compute linear transformation using linear regression for x and y separately.
 
     Args:
-        control_points (list): List of ((image_x, image_y), (longitude, latitude)) tuples
+        control_points (np.ndarray): Nx4 (image_x, image_y, longitude, latitude)
+            array as returned by load_control_points
 
     Returns:
         tuple: (transformation_matrix, control_point_bounds)
             - transformation_matrix: 2x3 numpy array for affine transform
             - control_point_bounds: (lon_min, lon_max, lat_min, lat_max)
     """
-    # Extract coordinates
-    src_points = np.float32([p[0] for p in control_points])  # image coords (x,y)
-    dst_points = np.float32([(p[1][0], p[1][1]) for p in control_points])  # geo coords (lon,lat)
+    # Image coords (x,y) and geo coords (lon,lat)
+    src_points = control_points[:, :2].astype(np.float32)
+    dst_points = control_points[:, 2:].astype(np.float32)
 
     # Get bounds of control points
     lon_min, lon_max = np.min(dst_points[:, 0]), np.max(dst_points[:, 0])
     lat_min, lat_max = np.min(dst_points[:, 1]), np.max(dst_points[:, 1])
 
     # Fit x coordinates (image x to longitude)
-    A = np.vstack([src_points[:,0], np.ones(len(src_points))]).T
-    scale_x, offset_x = np.linalg.lstsq(A, dst_points[:,0], rcond=None)[0]
+    scale_x, offset_x = fit_line(src_points[:, 0], dst_points[:, 0])
 
     # Fit y coordinates (image y to latitude)
-    A = np.vstack([src_points[:,1], np.ones(len(src_points))]).T
-    scale_y, offset_y = np.linalg.lstsq(A, dst_points[:,1], rcond=None)[0]
+    scale_y, offset_y = fit_line(src_points[:, 1], dst_points[:, 1])
 
     # Create transformation matrix
     matrix = np.array([
@@ -98,21 +127,6 @@ def compute_linear_transform(control_points):
     return matrix, (lon_min, lon_max, lat_min, lat_max)
 
 
-def transform_points(matrix, points):
-    """
-    Transform points using affine transformation matrix.
-
-    Args:
-        matrix (np.ndarray): 2x3 transformation matrix
-        points (np.ndarray): Nx1x2 array of points to transform
-
-    Returns:
-        np.ndarray: Transformed points in same shape as input
-    """
-    points = np.float32(points).reshape(-1, 1, 2)
-    return np.float32([matrix[:, :2] @ pt.T + matrix[:, 2] for pt in points.reshape(-1, 2)]).reshape(points.shape)
-
-
 def get_transformed_bounds(matrix, width, height):
     """
     Get geographic bounds by transforming image corners using provided dimensions.
@@ -125,26 +139,23 @@ def get_transformed_bounds(matrix, width, height):
     Returns:
         tuple: (lon_min, lon_max, lat_min, lat_max)
     """
-    # Create array of image corners
-    corners = np.array([
-        [0, 0],          # top-left
-        [width, 0],      # top-right
-        [width, height], # bottom-right
-        [0, height]      # bottom-left
-    ], dtype=np.float32).reshape(-1, 1, 2)
-
-    # Transform corners to geographic coordinates
-    geo_corners = transform_points(matrix, corners).reshape(-1, 2)
+    # The matrix has no shear, so each corner is a direct scale + offset
+    sx, sy = matrix[0, 0], matrix[1, 1]
+    ox, oy = matrix[0, 2], matrix[1, 2]
+    lons = (ox, ox + sx * width)
+    lats = (oy, oy + sy * height)
 
     print("\nTransformed corners (lon, lat):")
-    corner_names = ["Top-left", "Top-right", "Bottom-right", "Bottom-left"]
-    for name, (lon, lat) in zip(corner_names, geo_corners):
+    corners = [
+        ("Top-left", lons[0], lats[0]),
+        ("Top-right", lons[1], lats[0]),
+        ("Bottom-right", lons[1], lats[1]),
+        ("Bottom-left", lons[0], lats[1])
+    ]
+    for name, lon, lat in corners:
         print(f"  {name:11s}: ({lon:.6f}, {lat:.6f})")
 
-    # Get bounds
-    lons = geo_corners[:, 0]
-    lats = geo_corners[:, 1]
-    return np.min(lons), np.max(lons), np.min(lats), np.max(lats)
+    return min(lons), max(lons), min(lats), max(lats)
 
 
 def main():
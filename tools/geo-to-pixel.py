@@ -14,19 +14,75 @@ Licensed under MIT License
 import sys
 import json
 import argparse
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
 
-def geo_to_pixel(lat: float, lon: float, bounds: Dict[str, float],
-                 image_width: int, image_height: int) -> Tuple[int, int]:
+import numpy as np
+
+Coordinate = Union[float, np.ndarray]
+
+def _pixel_kernel(lat: float, lon: float, north: float, west: float,
+                  pixels_per_lon: float, pixels_per_lat: float) -> Tuple[int, int]:
+    """Scalar conversion with precomputed scale factors; see geo_to_pixel."""
+    x = round((lon - west) * pixels_per_lon)
+    y = round((north - lat) * pixels_per_lat)
+    return x, y
+
+@lru_cache(maxsize=1)
+def _numba_kernels() -> Optional[tuple]:
+    """
+    Compile the numba kernels on first use.
+
+    numba is optional and slow to import, so it is only loaded once a caller
+    actually needs the jitted code.
+
+    Returns:
+        tuple: (scalar_kernel, batch_kernel), or None if numba is unavailable
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    scalar_kernel = njit(_pixel_kernel)
+
+    @njit(parallel=True)
+    def batch_kernel(lats, lons, north, west, pixels_per_lon, pixels_per_lat):
+        n = lats.shape[0]
+        xs = np.empty(n, dtype=np.int32)
+        ys = np.empty(n, dtype=np.int32)
+        for i in prange(n):
+            xs[i] = np.rint((lons[i] - west) * pixels_per_lon)
+            ys[i] = np.rint((north - lats[i]) * pixels_per_lat)
+        return xs, ys
+
+    return scalar_kernel, batch_kernel
+
+def get_geo_to_pixel_kernel() -> Callable[..., Tuple[int, int]]:
+    """
+    Get the scalar conversion kernel for use inside other jitted loops.
+
+    The kernel takes (lat, lon, north, west, pixels_per_lon, pixels_per_lat).
+    It is numba-compiled when numba is installed, else a plain Python function.
+    """
+    kernels = _numba_kernels()
+    return kernels[0] if kernels else _pixel_kernel
+
+def geo_to_pixel(lat: Coordinate, lon: Coordinate, bounds: Dict[str, float],
+                 image_width: int, image_height: int) -> Tuple[Coordinate, Coordinate]:
     """
     Convert geographic coordinates to pixel coordinates within a bounded region.
 
     The conversion assumes a linear projection suitable for small geographic areas.
     For larger areas, consider using proper map projections.
 
+    Array inputs are converted in a single vectorized pass (a parallel numba
+    loop when numba is installed) and yield int32 arrays; scalar inputs
+    yield plain ints.
+
     Args:
-        lat: Latitude in WGS84 decimal degrees
-        lon: Longitude in WGS84 decimal degrees
+        lat: Latitude(s) in WGS84 decimal degrees
+        lon: Longitude(s) in WGS84 decimal degrees
         bounds: Dictionary containing north, south, east, west bounds in decimal degrees
         image_width: Width of the target image in pixels
         image_height: Height of the target image in pixels
@@ -40,12 +96,23 @@ def geo_to_pixel(lat: float, lon: float, bounds: Dict[str, float],
         >>> x, y = geo_to_pixel(-1.42, 149.63, bounds, 2048, 2048)
     """
     # Calculate conversion factors
-    lon_per_pixel = (bounds['east'] - bounds['west']) / image_width
-    lat_per_pixel = (bounds['north'] - bounds['south']) / image_height
+    pixels_per_lon = image_width / (bounds['east'] - bounds['west'])
+    pixels_per_lat = image_height / (bounds['north'] - bounds['south'])
 
     # Convert to pixel coordinates
-    x = round((lon - bounds['west']) / lon_per_pixel)
-    y = round((bounds['north'] - lat) / lat_per_pixel)
+    if np.ndim(lat) or np.ndim(lon):
+        lat, lon = np.broadcast_arrays(np.asarray(lat, dtype=np.float64),
+                                       np.asarray(lon, dtype=np.float64))
+        kernels = _numba_kernels()
+        if kernels:
+            x, y = kernels[1](lat.ravel(), lon.ravel(), bounds['north'],
+                              bounds['west'], pixels_per_lon, pixels_per_lat)
+            return x.reshape(lat.shape), y.reshape(lat.shape)
+        x = np.rint((lon - bounds['west']) * pixels_per_lon).astype(np.int32)
+        y = np.rint((bounds['north'] - lat) * pixels_per_lat).astype(np.int32)
+    else:
+        x, y = _pixel_kernel(lat, lon, bounds['north'], bounds['west'],
+                             pixels_per_lon, pixels_per_lat)
 
     return x, y
 
@@ -21,10 +21,14 @@ Requirements:
 import sys
 import argparse
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 import geopandas as gpd
+import numpy as np
+import pyproj
+import shapely
 from keplergl import KeplerGl
 
 # Configure logging
@@ -34,6 +38,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Target CRS, built once so comparisons don't reparse 'EPSG:4326'
+_WGS84 = pyproj.CRS.from_epsg(4326)
+
 class VisualizationError(Exception):
     """Custom exception for visualization-related errors."""
     pass
@@ -117,6 +124,50 @@ def create_kepler_config(bounds: list) -> dict:
         }
     }
 
+@lru_cache(maxsize=8)
+def get_wgs84_transformer(src_crs: pyproj.CRS) -> pyproj.Transformer:
+    """
+    Get a cached transformer from the given CRS to EPSG:4326.
+
+    Args:
+        src_crs: Source coordinate reference system
+
+    Returns:
+        pyproj.Transformer: Transformer producing (lon, lat) output
+    """
+    return pyproj.Transformer.from_crs(src_crs, _WGS84, always_xy=True)
+
+def reproject_to_wgs84(network: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Reproject a GeoDataFrame to EPSG:4326 in a single vectorized call.
+
+    All vertices are gathered into flat arrays, transformed at once with a
+    cached transformer, and written back into copies of the geometries.
+
+    Args:
+        network: GeoDataFrame with a defined CRS
+
+    Returns:
+        gpd.GeoDataFrame: Reprojected copy of the input
+
+    Raises:
+        ValueError: If the input has no CRS
+    """
+    if network.crs is None:
+        raise ValueError("Cannot transform naive geometries. "
+                         "Please set a crs on the object first.")
+
+    geoms = network.geometry.to_numpy()
+    if shapely.has_z(geoms).any():
+        # set_coordinates is 2D-only here; let geopandas handle 3D data
+        return network.to_crs(_WGS84)
+
+    transformer = get_wgs84_transformer(network.crs)
+    coords = shapely.get_coordinates(geoms)
+    lons, lats = transformer.transform(coords[:, 0], coords[:, 1])
+    reprojected = shapely.set_coordinates(geoms.copy(), np.column_stack([lons, lats]))
+    return network.set_geometry(gpd.GeoSeries(reprojected, index=network.index, crs=_WGS84))
+
 def create_visualization(
     input_file: Union[str, Path],
     output_file: Union[str, Path],
@@ -140,18 +191,19 @@ def create_visualization(
     """
     try:
         logger.info(f"Reading {input_file}...")
-        network = gpd.read_file(input_file)
-
         if subset:
-            network = network.head(subset)
+            # Limit the read itself so discarded features are never decoded
+            network = gpd.read_file(input_file, engine='pyogrio', rows=subset)
             logger.info(f"Using first {subset} features")
+        else:
+            network = gpd.read_file(input_file, engine='pyogrio')
 
         if network.empty:
             raise VisualizationError("No features found in input file")
 
-        if network.crs != 'EPSG:4326':
+        if network.crs is None or not network.crs.equals(_WGS84, ignore_axis_order=True):
             logger.info(f"Converting from {network.crs} to EPSG:4326...")
-            network = network.to_crs('EPSG:4326')
+            network = reproject_to_wgs84(network)
 
         # Calculate bounds
         total_bounds = network.total_bounds